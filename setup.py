@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Compiles the Cython modules for the Wordle exploration project ahead of time, so
+that they don't have to be compiled by pyximport when they're first imported.
+Run it once, from this directory, with
+
+    python setup.py build_ext --inplace
+
+and run it again after changing any of the .pyx files: the compiled modules are
+used in preference to the .pyx files whenever they exist.
+
+This program comes with ABSOLUTELY NO WARRANTY. Use at your own risk. It is
+copyright 2022 by Patrick Mooney. It is free software, and you are welcome to
+redistribute it under certain conditions, according to the GNU general public
+license, either version 3 or (at your own option) any later version. See the
+file LICENSE.md for details.
+"""
+
+
+from setuptools import setup
+
+from Cython.Build import cythonize              # http://cython.org
+
+
+setup(
+    name='wordle',
+    ext_modules=cythonize(['wordle_utils.pyx', 'strategies.pyx']),
+)
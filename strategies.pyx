@@ -14,7 +14,6 @@ file LICENSE.md for details.
 """
 
 
-import collections
 import numbers
 import random
 import string
@@ -61,7 +60,7 @@ class Strategy:
 
     @staticmethod
     # @abc.abstractmethod
-    def score(letter_frequencies: collections.Counter,
+    def score(letter_frequencies: typing.Mapping[str, int],
               untried_letters: str,
               w: str) -> typing.Type[numbers.Number]:
         """Assign a score to an individual guess. A guess that the Strategy thinks is
@@ -81,14 +80,15 @@ class Strategy:
         """
         solutions = {w: cls.solve_from(answer, w) for w in wu.known_five_letter_words}
         solutions = {k: v for k, v in solutions.items() if v}           # Filter out any non-answers, as in ShadePointCurly-type strategies
+        solved = [i for i in solutions.values() if i[-1].Solved]
         ret = {
             'solutions': solutions,
-            'number solved': len([i for i in solutions.values() if i[-1].Solved]),
+            'number solved': len(solved),
         }
-        if [i for i in solutions.values() if i[-1].Solved]:
+        if solved:
             ret.update({
-            'average moves': (sum([len(i) for i in solutions.values() if i[-1].Solved]) / len([i for i in solutions.values() if i[-1].Solved])),
-            'number of errors': len([i for i in solutions.values() if i[-1].ExhaustedErroneously])
+            'average moves': (sum(len(i) for i in solved) / len(solved)),
+            'number of errors': sum(1 for i in solutions.values() if i[-1].ExhaustedErroneously)
             })
         return ret
 
@@ -152,7 +152,7 @@ class GetMaximumInfoHardMode(Strategy):
     is_abstract = False
 
     @staticmethod
-    def score(letter_frequencies: collections.Counter,
+    def score(letter_frequencies: typing.Mapping[str, int],
               untried_letters: str,
               w: str) -> int:
         return wu.untried_word_score(letter_frequencies, untried_letters, w)
@@ -167,7 +167,7 @@ class RandomChoiceOnEachTurn(Strategy):
     is_abstract = False
 
     @staticmethod
-    def score(letter_frequencies: collections.Counter,
+    def score(letter_frequencies: typing.Mapping[str, int],
               untried_letters: str,
               w: str) -> typing.Type[numbers.Number]:
         return random.random()
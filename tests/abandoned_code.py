@@ -18,7 +18,9 @@ file LICENSE.md for details.
 
 
 import collections
-import shelve
+import itertools
+import pickle
+import sqlite3
 import time
 import typing
 
@@ -27,114 +29,148 @@ import wordle.strategies as strategies
 import wordle.wordle_explorer as we
 
 
-def exhaustively_analyze_with_shelve_extremely_slow() -> None:
+def open_solutions_db() -> sqlite3.Connection:
+    """Open the SQLite database that the functions below keep their data in, creating
+    it and its single table if necessary. This replaced a shelve-based store, whose
+    dbm + pickle combination handled lots of random writes badly and whose
+    writeback cache needed an awful lot of memory.
+
+    Each row holds one pickled strat.solve() result, keyed by (strategy, answer).
+    """
+    conn = sqlite3.connect('solutions.db')
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('CREATE TABLE IF NOT EXISTS solutions(strategy TEXT, answer TEXT, data BLOB, PRIMARY KEY(strategy, answer))')
+    return conn
+
+
+def exhaustively_analyze_with_db_extremely_slow() -> None:
     """For each strategy, evaluate each word that could possibly be an answer by
     starting from each possible starting word and using the strategy to solve from
     that starting word, keeping notes on moves made and how the parameters shift
     along the way.
 
-    This is a rather slow version because dereferencing dictionaries multiple times
-    inside a shelve-backed hashable is necessarily slow. Use the faster, similarly
-    named exhaustively_analyze() function below, instead.
+    This is a rather slow version because it stores the full, move-by-move results
+    of every solve() call in a database. Use the faster, similarly named
+    exhaustively_analyze() function in wordle_explorer.py, instead.
 
-    This gets slower as the analysis of a specific strategy progresses.
+    This used to keep its data in a shelve, re-opened with writeback=True for every
+    solution, with all of a strategy's results in one nested dictionary; that got
+    slower as the analysis of a specific strategy progressed.
     """
-    for strat in strategies.Strategy.all_strategies():
-        print(f'\nNow trying strategy {strat.__name__}')
-        for i, solution in enumerate(wu.known_five_letter_words, 1):
-            print(f"  Analyzing starting word success for solution #{i}: {solution.upper()} ...")
-            with shelve.open('solutions_cache', protocol=-1, writeback=True) as db:
-                if strat.__name__ not in db:
-                    db[strat.__name__] = dict()
+    conn = open_solutions_db()
+    try:
+        for strat in strategies.Strategy.all_strategies():
+            print(f'\nNow trying strategy {strat.__name__}')
+            already_done = {row[0] for row in conn.execute('SELECT answer FROM solutions WHERE strategy = ?', (strat.__name__,))}
+            for i, solution in enumerate(wu.known_five_letter_words, 1):
+                print(f"  Analyzing starting word success for solution #{i}: {solution.upper()} ...")
+                if solution in already_done:
+                    continue
                 t_start = time.monotonic()
-                if solution not in db[strat.__name__]:
-                    db[strat.__name__][solution] = strat.solve(solution)
-                    t_done = time.monotonic()
-                    print(f"    ... analyzed in {t_done - t_start} seconds!")
-            try:
-                t_update, _ = time.monotonic(), t_done
-            except (NameError,):
-                pass
-            else:
-                print(f"    ... database update took {t_update - t_done} seconds!")
-                del t_done, t_update
-
-
-def exhaustively_analyze_storing_data_with_shelve() -> None:
-    """Does the same thing as exhaustively_analyze_very_slow(), above, but is much
-    faster.
-    
-    However, getting the data back OUT of the shelve into a useful format is time-
+                conn.execute('INSERT INTO solutions VALUES (?, ?, ?)', (strat.__name__, solution, pickle.dumps(strat.solve(solution), protocol=-1)))
+                print(f"    ... analyzed and stored in {time.monotonic() - t_start} seconds!")
+                if i % 100 == 0:
+                    conn.commit()
+            conn.commit()
+    finally:
+        conn.close()
+
+
+def exhaustively_analyze_storing_data_in_db() -> None:
+    """Does the same thing as exhaustively_analyze_with_db_extremely_slow(), above,
+    but walks through the words in sorted order and reports how long each step
+    takes.
+
+    However, getting the data back OUT of the database into a useful format is time-
     consuming, and takes an awful lot of memory.
     """
-    def key_name(strategy: str, answer: str) -> str:
-        return str((strategy, answer))
-
-    for strat in strategies.Strategy.all_strategies():
-        print(f"\nNow trying strategy {strat.__name__}")
-        for i, solution in enumerate(sorted(wu.known_five_letter_words), 1):
-            print(f"  Analyzing starting word success for solution #{i}: {solution.upper()} ...")
-            t_open = time.monotonic()
-            with shelve.open('solutions_cache', protocol=-1, writeback=True) as db:
+    t_open = time.monotonic()
+    conn = open_solutions_db()
+    print(f"    ... initializing database connection took {time.monotonic() - t_open} seconds!")
+    try:
+        for strat in strategies.Strategy.all_strategies():
+            print(f"\nNow trying strategy {strat.__name__}")
+            already_done = {row[0] for row in conn.execute('SELECT answer FROM solutions WHERE strategy = ?', (strat.__name__,))}
+            for i, solution in enumerate(sorted(wu.known_five_letter_words), 1):
+                print(f"  Analyzing starting word success for solution #{i}: {solution.upper()} ...")
+                if solution in already_done:
+                    continue
                 t_start = time.monotonic()
-                print(f"    ... initializing database connection took {t_start - t_open} seconds!")
-                key = key_name(strat.__name__, solution)
-                if key not in db:
-                    analysis, t_done = strat.solve(solution), time.monotonic()
-                    print(f"    ... analyzed in {t_done - t_start} seconds!")
-                    db[key], t_stash = analysis, time.monotonic()
-                    print(f"    ... analysis stashed in database in {t_stash - t_done} seconds!")
-            try:
-                t_update, _ = time.monotonic(), t_stash
-            except (NameError, ):
-                pass
-            else:
-                print(f"    ... database update took {t_update - t_stash} seconds!")
-                del t_stash, t_done, t_update
-
-
-def export_shelve_db_to_bzip_files() -> None:
-    # export shelved data to lrzip-compressed JSON files. Fails: needs too much memory.
-    import json, sys
+                analysis, t_done = strat.solve(solution), time.monotonic()
+                print(f"    ... analyzed in {t_done - t_start} seconds!")
+                conn.execute('INSERT INTO solutions VALUES (?, ?, ?)', (strat.__name__, solution, pickle.dumps(analysis, protocol=-1)))
+                print(f"    ... analysis stashed in database in {time.monotonic() - t_done} seconds!")
+                if i % 100 == 0:
+                    conn.commit()
+            conn.commit()
+    finally:
+        conn.close()
+
+
+def export_solutions_db_to_bzip_files() -> None:
+    # export stored data to bzip2-compressed JSON files. Fails: needs too much memory.
+    import sys
     import bz2
-
-    shard_count, output = 0, dict()
-    with shelve.open('solutions_cache', protocol=-1) as db:
-        print("\n\nOpened database! Beginning run ...")
-        for i in sorted(db):
-            strategy, answer = eval(i)  # i is a stringified tuple of these two items
+    import orjson           # https://github.com/ijl/orjson
+
+    def to_json_type(o: typing.Any) -> typing.Any:
+        """Stand-ins for the types in solve() results that orjson doesn't handle itself."""
+        if isinstance(o, (set, frozenset)):
+            return sorted(o)
+        elif hasattr(o, '_asdict'):         # namedtuples, i.e. wu.SolutionData
+            return o._asdict()
+        return str(o)
+
+    def write_batch(output: dict, strategy: str, shard_count: int, answer: str) -> None:
+        output_name = we.solutions_cache / f"{strategy}_{shard_count}.json.bz2"
+        with bz2.open(output_name, mode="wb") as output_file:
+            output_file.write(orjson.dumps(output, option=orjson.OPT_SORT_KEYS, default=to_json_type))
+        print(f"  ... wrote {output_name} after re-packing {answer.upper()}")
+
+    conn = open_solutions_db()
+    print("\n\nOpened database! Beginning run ...")
+    rows = conn.execute('SELECT strategy, answer, data FROM solutions ORDER BY strategy, answer')
+    for strategy, group in itertools.groupby(rows, key=lambda row: row[0]):
+        shard_count, output = 0, dict()
+        for _, answer, data in group:
+            output[str((strategy, answer))] = pickle.loads(data)
             if len(output) > 50:
-                output_name = we.solutions_cache / f"{strategy}_{shard_count}.json.bz2"
-                with bz2.open(output_name, mode="wt", encoding='utf-8') as output_file:
-                    output_file.write(json.dumps(output, ensure_ascii=False, indent=None, separators=(',', ':'), sort_keys=True))
-                print(f"  ... wrote {output_name} after re-packing {answer.upper()}")
-                output = dict()
-                shard_count += 1
-            output[i] = db[i]
+                write_batch(output, strategy, shard_count, answer)
+                shard_count, output = shard_count + 1, dict()
+        if output:
+            write_batch(output, strategy, shard_count, answer)
+    conn.close()
 
     sys.exit()
 
 
-def export_shelve_db_to_lrzip_files() -> None:
-    import json, sys
-    import lrzip
+def export_solutions_db_to_lz4_shards() -> None:
+    """Re-pack the database into the same LZ4-compressed shards that
+    exhaustively_analyze() writes, so that summarize_analysis() can work from them.
 
-    count, output = 0, dict()
-    with shelve.open('solutions_cache', protocol=-1) as db:
-        print("\n\nOpened database! Beginning run ...")
-        for i in sorted(db):
-            strategy, answer = eval(i)  # i is a stringified tuple of these two items
-            if len(output) > 50:
-                text_data = json.dumps(output, ensure_ascii=False, indent=None, separators=(',', ':'), sort_keys=True)
-                compressed_data = lrzip.compress(text_data.encode(encoding='utf-8'), compressMode=lrzip.LRZIP_MODE_COMPRESS_ZPAQ)
-                output_name = we.solutions_cache / f"{strategy}_{count}.json.lrz"
-                (output_name).write_bytes(compressed_data)
-                print(f"  ... wrote {output_name} after re-packing {answer.upper()}")
-                count += 1
-
-                del text_data, compressed_data
-                output = dict()
-            output[i] = db[i]
+    This used to write lrzip-compressed JSON, flushing every 50 entries in
+    sorted-key order. Since keys for different strategies were interleaved, one
+    output file could straddle two strategies, and holding 50 full solve() results
+    in memory at once was already more than could be managed. Now each strategy is
+    exported separately, and each solve() result is condensed as soon as it's
+    read, so only one full result is ever in memory.
+    """
+    import sys
+
+    conn = open_solutions_db()
+    print("\n\nOpened database! Beginning run ...")
+    rows = conn.execute('SELECT strategy, answer, data FROM solutions ORDER BY strategy, answer')
+    for strategy, group in itertools.groupby(rows, key=lambda row: row[0]):
+        shard_count, output = 0, dict()
+        for _, answer, data in group:
+            output[we.key_name(strategy, answer)] = we.condense_solution(pickle.loads(data))
+            if len(output) >= we.max_entries_in_shard:
+                we.save_shard(output, strategy, shard_count, answer)
+                shard_count, output = shard_count + 1, dict()
+        if output:
+            we.save_shard(output, strategy, shard_count, answer)
+    conn.close()
 
     sys.exit()
 
@@ -18,125 +18,130 @@ file LICENSE.md for details.
 
 
 import bz2
+import csv
 import functools
 import gc
 import json
-import math
-import numbers
+import multiprocessing
 import pickle
+import queue
+import struct
 import time
 import threading
 import typing
 
 from pathlib import Path
 
+import lz4.frame                                # https://python-lz4.readthedocs.io/
 import numpy as np                              # https://numpy.org/
-import pandas as pd                             # https://pandas.pydata.org/
 
-try:
-    import pyximport; pyximport.install()       # http://cython.org
+try:                            # Use modules compiled ahead of time with "python setup.py build_ext --inplace", if there are any.
+    import wordle_utils as wu
+    import strategies
 except ImportError:
-    pass        # Allow running without installing Cython by renaming files from *.pyx to *py.
+    try:
+        import pyximport; pyximport.install()       # http://cython.org
+    except ImportError:
+        pass        # Allow running without installing Cython by renaming files from *.pyx to *py.
 
-import wordle_utils as wu
-import strategies
+    import wordle_utils as wu
+    import strategies
 
 
 solutions_cache = Path(__file__).parent / 'solutions'
 max_entries_in_shard = 25
+num_wordle_words = len(wu.known_five_letter_words)
 
-
-class NonNanFairLimitedHeap(wu.FairLimitedHeap):
-    """Just Like FairLimitedHeap, except that it silently declines to push items
-    onto the heap if the vlue assoociated with the item is a NaN value.
-    """
-    def push(self, item: typing.Any,
-             value: numbers.Number) -> None:
-        if np.isnan(value):
-            return
-        else:
-            wu.FairLimitedHeap.push(self, item, value)
-
-
-def key_name(strategy: str, answer: str) -> str:
-    """Convert this data pairing into a key that can be used to index a database in any
-    of several forms that we've tried keeping the database in.
-    """
-    return str((strategy, answer))
+# Each shard is saved as a NumPy record array with one record of this type per answer. See condense_solution().
+shard_record_type = np.dtype([('answer', 'U5'),
+                              ('solution lengths', np.int8, (num_wordle_words,)),
+                              ('total moves', np.int32),
+                              ('number of errors', np.int32)])
 
 
-def power_of_two_equal_to_or_greater_than(than_what: numbers.Number) -> int:
-    """If THAN_WHAT is a power of two, returns it. Otherwise, return the next power of
-    two greater than THAN_WHAT.
+def fairly_top_ranked(values: np.ndarray, limit: int) -> np.ndarray:
+    """Return the indices of the LIMIT highest non-NaN values in VALUES, in no
+    particular order. Like FairLimitedHeap, the limit is a "fair" one: any further
+    values tied with the lowest-ranked value that makes the cut are also included,
+    rather than arbitrarily dropping some of a group of equally good items.
     """
-    exp = int(math.log(than_what, 2))
-    if float(2 ** exp) == float(than_what):
-        return than_what
-    else:
-        return 2 ** (1 + exp)
+    candidates = np.flatnonzero(~np.isnan(values))
+    if len(candidates) <= limit:
+        return candidates
+    cutoff = np.partition(values[candidates], len(candidates) - limit)[len(candidates) - limit]
+    return candidates[values[candidates] >= cutoff]
 
 
-@functools.lru_cache(maxsize=power_of_two_equal_to_or_greater_than(len(wu.known_five_letter_words)))
-def strategy_name_from_key(key: str) -> str:
-    """A key name is a stringified (strategy name, answer) tuple. Process that tuple
-    to extract the strategy name and return it.
+def key_name(strategy: str, answer: str) -> typing.Tuple[str, str]:
+    """Convert this data pairing into a key that can be used to index the in-memory
+    collection of solutions built up before each shard is written. The key is just
+    the (strategy name, answer) tuple itself, so there's nothing to parse later.
     """
-    return key.strip().strip('()').strip().split(',')[0].strip().strip("'").strip()
+    return strategy, answer
 
 
-@functools.lru_cache(maxsize=power_of_two_equal_to_or_greater_than(len(wu.known_five_letter_words)))
-def answer_name_from_key(key: str) -> str:
-    """A key name is a stringified (strategy name, answer) tuple. Process that tuple
-    to extract the strategy name and return it.
+def answer_name_from_key(key: typing.Tuple[str, str]) -> str:
+    """Extract the answer from a key produced by key_name().
     """
-    return key.strip().strip('()').strip().split(',')[1].strip().strip("'").strip()
+    return key[1]
 
 
 def was_already_analyzed(strategy: strategies.Strategy) -> bool:
     """Return True if this Strategy has already had an analysis performed on it that
     resulted in summary data.
     """
-    allow_sloppy_detection = True  # debugging only!
-    if allow_sloppy_detection:
-        num_shards_needed = (len(wu.known_five_letter_words) // max_entries_in_shard) if ((len(wu.known_five_letter_words) % max_entries_in_shard) == 0) else 1 + (len(wu.known_five_letter_words) // max_entries_in_shard)
-        if len(list(solutions_cache.glob(f"{strategy.__name__}.pkl.lrz"))) == num_shards_needed:
-            return True
     return (solutions_cache / f"{strategy.__name__}_analysis.json.bz2").is_file()
 
 
-def get_shard_data(shard_path: Path) -> typing.Dict[str, dict]:
-    """Unpack a shard and do first-pass summarization on it, returning the dictionary
-    that results from the summarizing activity and containing much of the
+def write_shard_data(data: typing.Any, shard_file: typing.BinaryIO) -> None:
+    """Pickle DATA into SHARD_FILE using pickle protocol 5, with the raw data of any
+    NumPy arrays in DATA handled out-of-band, so that it goes straight into the
+    file instead of being copied through the pickle stream. The file holds:
+
+      * a header giving the length of the pickle stream and the number of
+        out-of-band buffers, followed by the length of each buffer;
+      * the pickle stream itself;
+      * each out-of-band buffer, in order.
+    """
+    buffers = list()
+    payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+    buffers = [b.raw() for b in buffers]
+    shard_file.write(struct.pack('<QI', len(payload), len(buffers)))
+    shard_file.write(struct.pack(f'<{len(buffers)}Q', *[b.nbytes for b in buffers]))
+    shard_file.write(payload)
+    for b in buffers:
+        shard_file.write(b)
+
+
+def read_shard_data(shard_data: bytes) -> typing.Any:
+    """Unpickle SHARD_DATA, the complete (decompressed) contents of a file written by
+    write_shard_data(), above. The out-of-band buffers are handed to pickle as
+    slices of SHARD_DATA, not copies, so NumPy arrays in the returned data are
+    read-only views into it.
+    """
+    view = memoryview(shard_data)
+    payload_length, num_buffers = struct.unpack_from('<QI', view)
+    offset = struct.calcsize('<QI')
+    buffer_lengths = struct.unpack_from(f'<{num_buffers}Q', view, offset)
+    offset += struct.calcsize(f'<{num_buffers}Q')
+    payload = view[offset:offset + payload_length]
+    offset += payload_length
+    buffers = list()
+    for length in buffer_lengths:
+        buffers.append(view[offset:offset + length])
+        offset += length
+    return pickle.loads(payload, buffers=buffers)
+
+
+def load_shard(shard_path: Path) -> np.ndarray:
+    """Unpack a shard and return the record array stored in it: one record of type
+    shard_record_type for each answer in the shard. The whole shard is read and
+    decompressed in one call, rather than being streamed through a file object.
     """
-    gc.collect()                # Big chunks of data involved here.
-    ret = dict()
     t_start = time.monotonic()
-    with bz2.open(shard_path, mode='rb') as shard_file:
-        unpacked_shard = pickle.load(shard_file)
+    unpacked_shard = read_shard_data(lz4.frame.decompress(shard_path.read_bytes()))
     print(f"    ... unpacked analysis-data shard {shard_path.name}, containing {len(unpacked_shard)} items, in {time.monotonic() - t_start} seconds")
-    t_after_unpacking = time.monotonic()
-    for answer, data in unpacked_shard.items():
-        ret[answer] = {
-            'solutions': {k: [{
-                'move': i.Move,
-                'initial possible letters': i.InitialPossibleLetters,
-                'known letters with unknown position before guess': i.KnownLettersWithUnknownPositionBeforeGuess,
-                'possible letters after guess': i.PossibleLettersAfterGuess,
-                'remaining possibilities': i.RemainingPossibilities,
-                'exhausted erroneously': i.ExhaustedErroneously,
-                'solved': i.Solved,
-            } for i in v] for k, v in data['solutions'].items()},
-            'average moves': data['average moves'] if ('average moves' in data) else None,
-            'number solved': data['number solved'] if ('number solved' in data) else None,
-            'number of errors': data['number of errors'] if ('number of errors' in data) else None,
-        }
-
-    # Try to avoid letting huge shards collect in memory
-    del unpacked_shard, answer, data
-    gc.collect()
-    print(f"      ... re-packed data in {time.monotonic() - t_after_unpacking} seconds")
-
-    return ret
+    return unpacked_shard
 
 
 @functools.lru_cache
@@ -144,23 +149,49 @@ def sorted_wordle_words() -> typing.List[str]:
     return sorted(wu.known_five_letter_words)
 
 
-@functools.lru_cache(maxsize=power_of_two_equal_to_or_greater_than(len(wu.known_five_letter_words)))
+word_indices = {w: i for i, w in enumerate(sorted_wordle_words())}
+
+
 def get_word_index(word: str) -> int:
     """Given WORD, a word in the list of known five-letter words that are Wordle
-    solutions, return its position in the list, where the position is going to be in
-    the range 0 <= pos < len(wu.known_five_letter_words).
+    solutions, return its position in the sorted list, where the position is going to
+    be in the range 0 <= pos < len(wu.known_five_letter_words). Raises KeyError if
+    WORD is not a known five-letter word.
+    """
+    return word_indices[word]
+
+
+def condense_solution(solution: dict) -> dict:
+    """Reduce SOLUTION, the dictionary returned by a Strategy's solve() method, to the
+    data that summarize_analysis() actually uses. The move-by-move details are
+    dropped; what's left is a dictionary with these keys:
+
+      * 'solution lengths': an int8 array with one entry per known word, in sorted
+        order, giving the number of moves needed to reach the answer when that word
+        is the first guess, or -1 if that first guess did not lead to a solution;
+      * 'total moves': the number of moves made across all first guesses, whether
+        or not they led to a solution;
+      * 'number of errors': how many first guesses exhausted the possibilities
+        erroneously.
     """
-    assert word in wu.known_five_letter_words
-    return sorted_wordle_words().index(word)
+    lengths = np.full(num_wordle_words, -1, dtype=np.int8)
+    for first_guess, moves in solution['solutions'].items():
+        if moves[-1].Solved:
+            lengths[get_word_index(first_guess)] = len(moves)
+    return {
+        'solution lengths': lengths,
+        'total moves': sum(len(moves) for moves in solution['solutions'].values()),
+        'number of errors': solution.get('number of errors') or 0,
+    }
 
 
 def summarize_analysis(strategy: strategies.Strategy) -> None:
     """Iterate back over the data we've generated, decompressing it and totalling up
-    relevant stats, then saving the summary to disk and deleting the huge shards of
+    relevant stats, then saving the summary to disk and deleting the shards of
     compressed data.
     """
     print(f"  ... summarizing strategy {strategy.__name__} ...")
-    relevant_shards = sorted(solutions_cache.glob(f"{strategy.__name__}*.pkl.bz2"))
+    relevant_shards = sorted(solutions_cache.glob(f"{strategy.__name__}*.pkl.lz4"))
 
     t_begin_whole_process = time.monotonic()
     output = {
@@ -168,49 +199,50 @@ def summarize_analysis(strategy: strategies.Strategy) -> None:
         'total errors': 0,
         'total moves': 0,
     }
-    solution_length_matrix = np.empty((len(wu.known_five_letter_words), len(wu.known_five_letter_words)), dtype=np.float64)
-    solution_length_matrix[:] = np.nan
+    solution_length_matrix = np.full((num_wordle_words, num_wordle_words), -1, dtype=np.int8)
 
     for current_shard_path in relevant_shards:
         current_shard_start = time.monotonic()
-        current_shard = get_shard_data(current_shard_path)
-        output['total errors'] += sum([i['number of errors'] for i in current_shard.values() if isinstance(i['number of errors'], numbers.Number)])
-        output['total moves'] += sum([sum([len(m) for m in sol['solutions'].values()]) for sol in current_shard.values()])
-        for answer in current_shard:
-            for first_guess in current_shard[answer]['solutions']:
-                if current_shard[answer]['solutions'][first_guess][-1]['solved']:
-                    solution_length_matrix[get_word_index(answer_name_from_key(answer))][get_word_index(first_guess)] = len(current_shard[answer]['solutions'][first_guess])
-            gc.collect()
+        current_shard = load_shard(current_shard_path)
+        rows = [get_word_index(answer) for answer in current_shard['answer']]
+        solution_length_matrix[rows] = current_shard['solution lengths']
+        output['total moves'] += int(current_shard['total moves'].sum())
+        output['total errors'] += int(current_shard['number of errors'].sum())
+        del current_shard           # Reference counting frees it right away: a record array holds no reference cycles.
         print(f"        ... processed entire shard in {time.monotonic() - current_shard_start} seconds")
     print(f"  ... unpacked and summarized all shards in {time.monotonic() - t_begin_whole_process} seconds!")
 
-    solution_length_matrix = pd.DataFrame(solution_length_matrix, columns=sorted_wordle_words(), index=sorted_wordle_words())
-    solution_matrix_filename = solutions_cache / f"{strategy.__name__}_solution_matrix.csv.bz2"
+    # Rows are answers and columns are starting words, both in sorted order; -1 means "no solution found."
+    solution_matrix_filename = solutions_cache / f"{strategy.__name__}_solution_matrix.npz"
     print(f"  ... saving solution length matrix {solution_matrix_filename} ...")
-    solution_length_matrix.to_csv(solution_matrix_filename, na_rep='NULL')
+    np.savez_compressed(solution_matrix_filename, lengths=solution_length_matrix, words=np.array(sorted_wordle_words()))
+
+    solved = solution_length_matrix >= 0
 
-    output.update({'total solved': solution_length_matrix.count().sum(),
-                   'total unsolved': (len(wu.known_five_letter_words) ** 2) - solution_length_matrix.count().sum(),
-                   'median moves': solution_length_matrix.stack().median(),
-                   'mean moves': solution_length_matrix.stack().mean(),
+    col_counts = solved.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):    # Columns with no solutions at all get a NaN mean.
+        col_means = np.where(solved, solution_length_matrix, 0).sum(axis=0) / col_counts
+
+    all_solution_lengths = solution_length_matrix[solved]      # Pull out the solved cells only once for all the stats.
+    num_solved = all_solution_lengths.size
+    output.update({'total solved': num_solved,
+                   'total unsolved': (num_wordle_words ** 2) - num_solved,
+                   'median moves': np.median(all_solution_lengths),
+                   'mean moves': all_solution_lengths.mean(),
                    })
+    del all_solution_lengths
 
     # All right, now compute the best and worst starting guesses, overall. Starting guesses are in columns.
-    # "Worst" guesses are computed with an arithmetic inverse of the average score because the heap keeps "high" values.
-    worst_initial_guesses, best_initial_guesses = NonNanFairLimitedHeap(100), NonNanFairLimitedHeap(100)
-    non_solutions = list()
-
-    for col in solution_length_matrix:
-        avg = solution_length_matrix[col].mean()
-        worst_initial_guesses.push(col, avg)
-        best_initial_guesses.push(col, -avg)
-
-        non_sols = len(solution_length_matrix) - solution_length_matrix[col].count()
-        if non_sols:
-            non_solutions.append((col, non_sols))
+    # "Best" guesses are computed with an arithmetic inverse of the average score because fairly_top_ranked() keeps "high" values.
+    words = sorted_wordle_words()
+    best_initial_guesses = sorted((-col_means[i], words[i]) for i in fairly_top_ranked(-col_means, 100))
+    worst_initial_guesses = sorted((col_means[i], words[i]) for i in fairly_top_ranked(col_means, 100))
+    non_solution_counts = len(solution_length_matrix) - col_counts
+    non_solutions = [(words[i], int(non_solution_counts[i])) for i in np.flatnonzero(non_solution_counts)]
+
     output.update({
-        'best starting words': [(-v, i) for v, i in best_initial_guesses.as_sorted_list(include_values=True)],
-        'worst starting words': worst_initial_guesses.as_sorted_list(include_values=True)[:-1],
+        'best starting words': [(-v, i) for v, i in best_initial_guesses],
+        'worst starting words': worst_initial_guesses[:-1],
         "starting words that end in non-solutions sometimes": non_solutions or None
     })
 
@@ -226,57 +258,142 @@ def summarize_analysis(strategy: strategies.Strategy) -> None:
     print(f"  ... finished summarizing, writing to disk, and cleaning up!\n")
 
 
+def export_solution_matrix_to_csv(strategy_name: str) -> Path:
+    """Convert the .npz solution-length matrix saved by summarize_analysis() for the
+    strategy named STRATEGY_NAME into a bz2-compressed CSV file, for anything that
+    wants the matrix as text. Rows are answers and columns are starting words; cells
+    where no solution was found are written as NULL. This isn't part of the
+    analysis run itself, because formatting millions of cells as text is slow.
+    Returns the path to the CSV file.
+    """
+    with np.load(solutions_cache / f"{strategy_name}_solution_matrix.npz") as matrix_file:
+        lengths, words = matrix_file['lengths'], matrix_file['words'].tolist()
+
+    csv_filename = solutions_cache / f"{strategy_name}_solution_matrix.csv.bz2"
+    with bz2.open(csv_filename, mode='wt', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow([''] + words)
+        for answer, row in zip(words, lengths.tolist()):
+            writer.writerow([answer] + [(length if length >= 0 else 'NULL') for length in row])
+    return csv_filename
+
+
 def save_shard(output, strat_name, shard_count, last_solution_processed) -> None:
-    """Meant to be spun off into a thread to allow the main process to continue. Can
-    be run directly if convenient, though.
+    """Normally called from the shard_writer() thread, below, to allow the main
+    process to continue. Can be run directly if convenient, though.
+
+    OUTPUT maps key names to condensed solutions, as produced by
+    condense_solution(). It's packed into a single NumPy record array before being
+    saved, so that the whole shard is one contiguous buffer instead of a pile of
+    small Python objects.
     """
     t_start = time.monotonic()
-    output_name = solutions_cache / f"{strat_name}_{shard_count:05d}.pkl.bz2"
-    with bz2.open(output_name, mode='wb') as output_file:
-        output_file.write(pickle.dumps(output, protocol=-1))
+    records = np.array([(answer_name_from_key(key), data['solution lengths'], data['total moves'], data['number of errors'])
+                        for key, data in output.items()], dtype=shard_record_type)
+    output_name = solutions_cache / f"{strat_name}_{shard_count:05d}.pkl.lz4"
+    with lz4.frame.open(output_name, mode='wb', compression_level=0) as output_file:
+        write_shard_data(records, output_file)
     print(f"  ... took {time.monotonic() - t_start} seconds to compress and write {output_name} after processing {last_solution_processed.upper()}")
 
 
+def shard_writer(shard_queue: queue.Queue,
+                 errors: typing.List[Exception]) -> None:
+    """Meant to be run as a long-lived thread. Takes (output, strategy name, shard
+    number, last solution processed) tuples off SHARD_QUEUE and saves each of them
+    with save_shard(), marking each task done once it's written, until it gets None.
+
+    If saving a shard fails, the exception is appended to ERRORS for the main thread
+    to re-raise, and any further shards are discarded without being saved. The
+    thread keeps taking items off the queue, though, so that nothing waiting on the
+    queue blocks forever.
+    """
+    while True:
+        item = shard_queue.get()
+        try:
+            if item is None:
+                return
+            if not errors:
+                save_shard(*item)
+        except Exception as errrr:
+            errors.append(errrr)
+        finally:
+            shard_queue.task_done()
+
+
+def raise_shard_writer_errors(errors: typing.List[Exception]) -> None:
+    """Re-raise, in the calling thread, the first exception that shard_writer() hit
+    while saving a shard, if there was one.
+    """
+    if errors:
+        raise errors[0]
+
+
+def solve_and_condense(task: typing.Tuple[str, str]) -> typing.Tuple[str, dict]:
+    """Run in a worker process by exhaustively_analyze(). TASK is a (strategy name,
+    answer) tuple. Looks up the Strategy by name, since the Strategy classes
+    themselves would otherwise need to be pickled to send them to the worker, and
+    returns an (answer, condensed solution) tuple. Condensing happens here in the
+    worker, so that only the compact form is sent back to the main process.
+    """
+    strat_name, answer = task
+    strat = [s for s in strategies.Strategy.all_strategies() if s.__name__ == strat_name][0]
+    return answer, condense_solution(strat.solve(answer))
+
+
 def exhaustively_analyze() -> None:
     """Go through each known strategy, collecting data while using the strategy to
     attempt to derive each possibly solution from each possible starting word,
     keeping data along the way.
     """
-    for strat in set(strategies.Strategy.all_strategies()):
-        if strat.is_abstract:
-            print(f"Skipping abstract strategy {strat.__name__.upper()}!")
-            continue
-
-        if was_already_analyzed(strat):
-            print(f"Skipping already-analyzed strategy {strat.__name__.upper()}!")
-            continue
-
-        already_done = list(solutions_cache.glob(f"{strat.__name__}_*.pkl.bz2"))
-        print(f"\nNow trying strategy {strat.__name__}")
-
-        shard_number, output, save_thread = 0, dict(), None     # Basic parameters controlling how sharded data is saved.
-        for (i, solution) in enumerate(sorted_wordle_words(), 1):
-            if (i <= (len(already_done) * max_entries_in_shard)):
-                shard_number = len(already_done)
-                continue        # If we're resuming a previous run, skip the starting points we've already analyzed.
-            print(f"  Analyzing starting word success for solution #{i}: {solution.upper()} ...")
-            key = key_name(strat.__name__, solution)
-            output[key] = strat.solve(solution)
-
-            if (len(output) >= max_entries_in_shard) or (i == len(wu.known_five_letter_words)):
-                # Have we accumulated enough data to save another shard? Do so.                if save_thread:             # If we've already got a saved thread, wait for it to finish.
-                if save_thread and (save_thread.is_alive()):
-                    print("    ... waiting for previous save to finish ...")
-                    save_thread.join()      # Otherwise, reap any zombie threads that may be occurring.
-                save_thread = threading.Thread(target=save_shard, args=(output, strat.__name__, shard_number, solution))
-                save_thread.start()
-                output = dict()
-                shard_number += 1
-        if save_thread:
-            save_thread.join()
-        del output
-        gc.collect()
-        summarize_analysis(strat)
+    # One pool of worker processes is used for every strategy. Worker processes keep their own caches (for instance,
+    # wu.solutions_matching()), and those carry over from one strategy to the next. The pool is created before the
+    # shard-writing thread is started, so that the worker processes aren't forked from a process that's running threads.
+    pool = multiprocessing.Pool()
+
+    # A single thread saves shards while analysis continues. The queue is bounded so that finished shards can't pile
+    # up in memory if compressing and writing them ever falls behind.
+    shard_queue, shard_errors = queue.Queue(maxsize=2), list()
+    writer = threading.Thread(target=shard_writer, args=(shard_queue, shard_errors))
+    writer.start()
+    try:
+        for strat in set(strategies.Strategy.all_strategies()):
+            if strat.is_abstract:
+                print(f"Skipping abstract strategy {strat.__name__.upper()}!")
+                continue
+
+            if was_already_analyzed(strat):
+                print(f"Skipping already-analyzed strategy {strat.__name__.upper()}!")
+                continue
+
+            already_done = list(solutions_cache.glob(f"{strat.__name__}_*.pkl.lz4"))
+            print(f"\nNow trying strategy {strat.__name__}")
+
+            # If we're resuming a previous run, skip the starting points we've already analyzed.
+            num_already_done = len(already_done) * max_entries_in_shard
+            shard_number, output = len(already_done), dict()        # Basic parameters controlling how sharded data is saved.
+
+            # Solutions come back from the pool in order, so each shard still covers a contiguous run of the sorted word
+            # list, which is what lets an interrupted run be resumed, above.
+            tasks = [(strat.__name__, solution) for solution in sorted_wordle_words()[num_already_done:]]
+            for (i, (solution, result)) in enumerate(pool.imap(solve_and_condense, tasks), 1 + num_already_done):
+                print(f"  Analyzed starting word success for solution #{i}: {solution.upper()}")
+                output[key_name(strat.__name__, solution)] = result
+
+                if (len(output) >= max_entries_in_shard) or (i == num_wordle_words):
+                    # Have we accumulated enough data to save another shard? Hand it off to be saved.
+                    raise_shard_writer_errors(shard_errors)
+                    shard_queue.put((output, strat.__name__, shard_number, solution))
+                    output = dict()
+                    shard_number += 1
+            shard_queue.join()          # Make sure all shards for this strategy are on disk before summarizing.
+            raise_shard_writer_errors(shard_errors)
+            del output
+            gc.collect()
+            summarize_analysis(strat)
+    finally:
+        pool.terminate()
+        shard_queue.put(None)       # Let the writer finish whatever it has, then stop.
+        writer.join()
 
 if __name__ == "__main__":
     if False:                       # Harness for testing FairLimitedHeap
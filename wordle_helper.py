@@ -35,12 +35,15 @@ import typing
 import string
 import sys
 
-try:
-    import pyximport; pyximport.install()       # http://cython.org
-except (ImportError,):                          # Allow running from setups that don't have Cython installed ...
-    pass                                        # ... by renaming *.pyx files to *.py
+try:                                            # Use a module compiled ahead of time with setup.py, if there is one.
+    import wordle_utils as wu
+except (ImportError,):
+    try:
+        import pyximport; pyximport.install()   # http://cython.org
+    except (ImportError,):                      # Allow running from setups that don't have Cython installed ...
+        pass                                    # ... by renaming *.pyx files to *.py
 
-import wordle_utils as wu
+    import wordle_utils as wu
 
 
 print('\n\n\nStarting up ...')
@@ -90,8 +93,7 @@ if __name__ == "__main__":
     known_letters, untried_letters, letter_frequencies, possible_answers = prompt_and_solve()
     print("Possible answers:")
 
-    if possible_answers:
-        for w in wu.ranked_answers(possible_answers, letter_frequencies, untried_letters):
-            print(w)
+    if possible_answers:        # Write the whole list at once instead of with one print() call per word.
+        sys.stdout.write('\n'.join(wu.ranked_answers(possible_answers, letter_frequencies, untried_letters)) + '\n')
     else:
         print("No possibilities found!")
@@ -14,11 +14,13 @@ file LICENSE.md for details.
 
 
 import collections
+import functools
 import heapq
 import numbers
 import re
 import reprlib
 import string
+import types
 import typing
 import unicodedata
 
@@ -32,6 +34,13 @@ word_list_file = Path('/home/patrick/Documents/programming/resources/word-lists/
 word_list_text = word_list_file.read_text()
 known_english_words = [w.strip() for w in word_list_text.split('\n') if w.strip()]
 known_five_letter_words = {w for w in known_english_words if len(w) == 5}
+five_letter_words_text = '\n'.join([w for w in known_english_words if len(w) == 5])   # searched by enumerate_solutions()
+
+# How many results solutions_matching() keeps cached in each process. On the full word list, each entry takes about
+# 4 KB, and a single Strategy.solve() call produces something like 6000 distinct sets of constraints, most of the
+# reuse happening within that one call; so this keeps roughly one solve()'s worth of results, about 32 MB per process.
+# Every worker process in wordle_explorer.py's pool has its own cache, so raise this with care.
+solutions_cache_size = 2 ** 13
 
 
 SolutionData = collections.namedtuple('SolutionData', ('Move',
@@ -113,7 +122,7 @@ def word_weight(word: str,
 # Functions that are used directly by other code to help amanage the changing set of parameters as guesses are tried by
 # various strategies.
 def enumerate_solutions(possible: typing.Dict[int, str],
-                        ambiguous_pos: str) -> typing.Tuple[collections.Counter, typing.Set[str]]:
+                        ambiguous_pos: str) -> typing.Tuple[typing.Mapping[str, int], typing.Tuple[str, ...]]:
     """Given POSSIBLE and AMBIGUOUS_POS, generate a list of words in the known words
     list that might be the word we're looking for, i.e. don't violate the currently
     known constraints.
@@ -129,16 +138,31 @@ def enumerate_solutions(possible: typing.Dict[int, str],
     the answer we're looking for to how often those letters occur in the possibility
     set.
 
-    Returns a Set of maybe-words and the Counter mapping the letters in those words
-    to their frequency in the maybe-words.
+    Returns a tuple of maybe-words and a read-only Counter mapping the letters in
+    those words to their frequency in the maybe-words. Both are cached and shared
+    between calls that specify the same constraints, which is why they're immutable.
+    """
+    # One lookahead for each letter that must appear somewhere in the word ('.' stops at the end of the line), then
+    # one character class for each position.
+    regex = '(?m)^' + ''.join([f"(?=.*{re.escape(c)})" for c in sorted(set(ambiguous_pos))])
+    regex += ''.join([f"[{''.join(sorted(i))}]" for i in possible.values()]) + '$'
+    return solutions_matching(regex)
+
+
+@functools.lru_cache(maxsize=solutions_cache_size)
+def solutions_matching(regex: str) -> typing.Tuple[typing.Mapping[str, int], typing.Tuple[str, ...]]:
+    """Does the actual work for enumerate_solutions(), above, which boils its
+    constraints down to REGEX first. Strategies arrive at the same set of
+    constraints over and over again (every starting word produces the same
+    constraints against many different answers, for instance), so the results are
+    cached, per process.
     """
-    regex = ''.join([f"[{''.join(sorted(i))}]" for i in possible.values()]) + "\n"
-    possible_answers = [ans.strip() for ans in re.findall(regex, word_list_text) if all(c in ans for c in ambiguous_pos)]
+    possible_answers = tuple(re.findall(regex, five_letter_words_text))
     letter_frequencies = collections.Counter(''.join(possible_answers))
-    return letter_frequencies, possible_answers
+    return types.MappingProxyType(letter_frequencies), possible_answers
 
 
-def untried_word_score(letter_frequencies: collections.Counter,
+def untried_word_score(letter_frequencies: typing.Mapping[str, int],
                        untried_letters: str,
                        w: str) -> int:
     """Produce a score for W, a word that has not yet been attempted. The score depends
@@ -154,11 +178,12 @@ def untried_word_score(letter_frequencies: collections.Counter,
     new letters as possible" is further incentivized by multiplying the derived
     score-sum by the number of unique letters in the word to derive the final score.
     """
-    return sum([letter_frequencies[c] for i, c in enumerate(w) if ((c in untried_letters) and (c not in w[:i]))]) * len(set(w))
+    letters = set(w)            # Each letter counts only once, however often it appears in W.
+    return sum(letter_frequencies[c] for c in letters if (c in untried_letters)) * len(letters)
 
 
-def ranked_answers(possible_answers: typing.List[str],
-                   letter_frequencies: collections.Counter,
+def ranked_answers(possible_answers: typing.Sequence[str],
+                   letter_frequencies: typing.Mapping[str, int],
                    untried_letters: str):
     def ranker(w) -> int:
         return untried_word_score(letter_frequencies, untried_letters, w)
@@ -242,6 +267,7 @@ class FairLimitedHeap(collections.abc.Iterable):
                 assert isinstance(item, numbers.Number)
         self._soft_limit = soft_limit
         self._data = [][:]
+        self._score_counts = collections.Counter()      # Maps each score to the number of items on the heap with that score.
         for item, value in initial:
             self.push(value, item)
 
@@ -276,25 +302,27 @@ class FairLimitedHeap(collections.abc.Iterable):
     def push(self, item: typing.Any,
               value: numbers.Number) -> None:
         heapq.heappush(self._data, (value, item))
-        if len(self._data) <= self._soft_limit:
-            return
-
-        # Find the index of the item after last item in the heap with same VALUE as the item at the low end of the heap
-        for index, item in enumerate(self._data):
-            if index == 0:
-                comp_value = item[0]
-            elif item[0] != comp_value:     # exact equality good enough, even if difference is tiny.
-                break
+        self._score_counts[value] += 1
 
-        if (len(self._data) - index) >= self._soft_limit:
-             for i in range(index):
-                 heapq.heappop(self._data)
+        # Drop all of the items tied for the lowest score at once, but only if that still leaves SOFT_LIMIT items.
+        while len(self._data) > self._soft_limit:
+            low_score = self._data[0][0]
+            num_tied = self._score_counts[low_score]
+            if (len(self._data) - num_tied) < self._soft_limit:
+                break
+            for _ in range(num_tied):
+                heapq.heappop(self._data)
+            del self._score_counts[low_score]
 
     def pop(self, also_return_score: bool = False) -> typing.Any:
+        score, item = heapq.heappop(self._data)
+        self._score_counts[score] -= 1
+        if not self._score_counts[score]:
+            del self._score_counts[score]
         if also_return_score:
-            return heapq.heappop(self._data)
+            return score, item
         else:
-            return heapq.heappop(self._data[1])
+            return item
 
     def as_sorted_list(self, include_values: bool = False) -> typing.List[typing.Tuple[numbers.Number, typing.Any]]:
         """Returns the contents of the heap in sorted-by-priority order. If